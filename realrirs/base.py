@@ -1,6 +1,11 @@
 import abc
+import collections
+import concurrent.futures
+import functools
 import os
 import pathlib
+import pickle
+import re
 from typing import Generic, Iterable, List, NewType, Optional, Sequence, Tuple, TypeVar
 import numpy as np
 
@@ -10,18 +15,152 @@ IR = NewType("IR", np.ndarray)
 NAME_T = TypeVar("NAME_T")
 
 
+def _exclude_pattern_to_re(pattern: str) -> str:
+    """Translate a `PurePath.match` style pattern into a regex fragment
+    matching the trailing components of a ``/``-separated path string."""
+    parts = []
+    for part in pattern.split("/"):
+        frag = ""
+        for ch in part:
+            if ch == "*":
+                frag += "[^/]*"
+            elif ch == "?":
+                frag += "[^/]"
+            else:
+                frag += re.escape(ch)
+        parts.append(frag)
+    return "(?:^|/)" + "/".join(parts) + "$"
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_exclude_re(patterns: Tuple[str, ...]):
+    """Compile `patterns` into a single alternation regex, or None if empty."""
+    if not patterns:
+        return None
+    return re.compile("|".join(_exclude_pattern_to_re(p) for p in patterns))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_glob_pattern(pattern: str):
+    return re.compile(_glob_pattern_to_re(pattern))
+
+
+def _glob_pattern_to_re(pattern: str) -> str:
+    """Translate a glob pattern (incl. ``**``) into a regex matching a full
+    ``/``-separated path relative to the dataset root."""
+    out = "^"
+    parts = pattern.split("/")
+    for i, part in enumerate(parts):
+        if part == "**":
+            out += "(?:[^/]+/)*"
+        else:
+            for ch in part:
+                if ch == "*":
+                    out += "[^/]*"
+                elif ch == "?":
+                    out += "[^/]"
+                else:
+                    out += re.escape(ch)
+            if i < len(parts) - 1:
+                out += "/"
+    return out + "$"
+
+
+def _walk_files(root: pathlib.Path) -> List[str]:
+    """List all files below `root` as ``/``-separated relative paths.
+
+    Uses `os.scandir` (whose DirEntry type checks need no extra stat call)
+    and recurses into subdirectories on a thread pool, so directory listing
+    round-trips overlap on high-latency filesystems.
+    """
+    files = []
+
+    def scan(path, rel):
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, f"{rel}{entry.name}/"))
+                    elif entry.is_file():
+                        files.append(f"{rel}{entry.name}")
+        except OSError:
+            pass
+        return subdirs
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        pending = {executor.submit(scan, str(root), "")}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                for subdir in future.result():
+                    pending.add(executor.submit(scan, *subdir))
+    return files
+
+
+def _advise_willneed(f):
+    """Hint the kernel to start reading `f` into the page cache."""
+    if f is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(str(f), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=128)
+def _list_files_cached(
+    root: pathlib.Path,
+    file_patterns: Tuple[str, ...],
+    exclude_patterns: Tuple[str, ...],
+    root_mtime_ns: Optional[int],
+) -> Tuple[pathlib.Path, ...]:
+    """Glob `file_patterns` below `root`, shared across dataset instances.
+
+    Re-instantiating a dataset on the same root (notebook reloads, repeated
+    construction in scripts) reuses the previous directory walk.
+    `root_mtime_ns` is part of the cache key so that adding or removing
+    entries directly below the root invalidates the listing; changes deeper
+    in the tree do not bump the root's mtime and are not detected.
+    """
+    exclude_re = _compile_exclude_re(exclude_patterns)
+    files = sorted(_walk_files(root))
+    out = []
+    for p in file_patterns:
+        pattern_re = _compile_glob_pattern(p)
+        # Filter on the relative path strings; Path objects are only built
+        # for the files that survive both filters.
+        out.extend(
+            root.joinpath(rel)
+            for rel in files
+            if pattern_re.match(rel)
+            and (exclude_re is None or not exclude_re.search(rel))
+        )
+    return tuple(out)
+
+
 def shape(things):
     """Get shape in a way that also understands Python lists."""
-    try:
-        return things.shape
-    except AttributeError:
-        shapes = list(map(shape, things))
-        assert len(set(shapes)) == 1
-        return (len(shapes), *shapes[0])
+    s = getattr(things, "shape", None)
+    if s is not None:
+        return s
+    first = np.shape(things[0])
+    assert all(np.shape(t) == first for t in things)
+    return (len(things), *first)
 
 
 def check_nonmono(x):
-    """Check that `x` is of shape `(chans, samples)`"""
+    """Check that `x` is of shape `(chans, samples)`.
+
+    This is a developer sanity check on the dataset loaders, not input
+    validation; it is skipped entirely when running with ``python -O``.
+    """
     assert (
         len(shape(x)) == 2 and shape(x)[0] < 10
     ), f"Shape should be (channels, samples) but is {shape(x)}"
@@ -84,6 +223,34 @@ class IRDataset(Generic[NAME_T]):
             samples (duration) of the IR, and `sr` is the IR's sample rate.
         """
 
+    def list_irs_arrays(self):
+        """Column-wise variant of `list_irs`.
+
+        Returns:
+            Tuple of (names, nchans, nsamples, srs) where `names` is a list
+            and the other three are numpy arrays, one entry per IR.  Useful
+            for vectorized aggregation over large datasets instead of
+            unpacking thousands of Python tuples.
+        """
+        irs = self.list_irs()
+        names = [name for name, *_ in irs]
+        nchans = np.fromiter((m[1] for m in irs), dtype=np.int32, count=len(irs))
+        nsamples = np.fromiter((m[2] for m in irs), dtype=np.int64, count=len(irs))
+        srs = np.fromiter((m[3] for m in irs), dtype=np.int32, count=len(irs))
+        return names, nchans, nsamples, srs
+
+    def trimmed_len(self, name: NAME_T) -> int:
+        """Number of samples of `name`'s IR (first channel) with leading and
+        trailing zeros removed.
+
+        This default decodes the full IR; subclasses override it with
+        header/seek tricks where the format allows.
+        """
+        nonzero = np.flatnonzero(self[name][0])
+        if nonzero.size == 0:
+            return 0
+        return int(nonzero[-1] - nonzero[0] + 1)
+
     def __str__(self):
         return f"{self.__class__} ({self.name})"
 
@@ -93,23 +260,29 @@ class FileIRDataset(IRDataset[NAME_T]):
 
     Args:
         root (pathlib.Path or str): Root directory where the dataset resides.
+        num_workers (int, optional): Number of threads used to read IRs in
+            parallel in `getall`.  By default IRs are read sequentially.
     """
 
     file_patterns: Sequence[str]
     exclude_patterns: Sequence[str] = ()
+    #: Name of the on-disk IR metadata cache, stored inside `root`.
+    #: Set to None to disable the cache.
+    metadata_cache_name: Optional[str] = ".realrirs_cache.pickle"
     _files_list: List[pathlib.Path]
 
-    def __init__(self, root: pathlib.Path):
+    def __init__(self, root: pathlib.Path, num_workers: Optional[int] = None):
         super().__init__()
         self.root = pathlib.Path(root)
+        self.num_workers = num_workers
 
     @abc.abstractmethod
     def _get_ir(self, name: NAME_T) -> IR:
         """Retrieve a single IR."""
 
     @abc.abstractmethod
-    def _list_irs(self) -> List[Tuple[NAME_T, int, int, int]]:
-        """See ``.list_irs``."""
+    def _list_irs(self) -> Iterable[Tuple[NAME_T, int, int, int]]:
+        """See ``.list_irs``.  May return a sequence or a generator."""
 
     def __str__(self):
         return super().__str__() + f" root={self.root}"
@@ -124,26 +297,83 @@ class FileIRDataset(IRDataset[NAME_T]):
             self._files_list = self._list_files()
 
     def _list_files(self) -> List[pathlib.Path]:
-        return [
-            f
-            for p in self.file_patterns
-            for f in sorted(self.root.glob(p.replace("/", os.sep)))
-            if not any(f.match(e) for e in self.exclude_patterns)
-        ]
+        try:
+            root_mtime_ns = self.root.stat().st_mtime_ns
+        except OSError:
+            root_mtime_ns = None
+        return list(
+            _list_files_cached(
+                self.root,
+                tuple(self.file_patterns),
+                tuple(self.exclude_patterns),
+                root_mtime_ns,
+            )
+        )
 
     def getall(self):
         self._populate_irs_list()
-        for name, sr, ir in self._getall():
-            check_nonmono(ir)
+        files = [self._file_for_name(name) for name in self._ir_names()]
+        for i, (name, sr, ir) in enumerate(self._getall()):
+            # Prefetch the next IR's file while the consumer processes the
+            # current one, hiding read latency behind user work.
+            if i + 1 < len(files) and files[i + 1] != files[i]:
+                _advise_willneed(files[i + 1])
+            if __debug__:
+                check_nonmono(ir)
             yield name, sr, ir
 
+    def _ir_names(self):
+        """All IR names, in `list_irs` order, without forcing metadata probes."""
+        if isinstance(self._irs_list, LazyIRList):
+            return self._irs_list.names
+        return [name for name, *_ in self._irs_list]
+
+    #: Bytes of each file to prefetch ahead of a metadata scan.
+    header_prefetch_bytes = 64 * 1024
+
+    def _prefetch_headers(self, files):
+        """Batch-hint the kernel at every file's header region.
+
+        Called before metadata scans that read one header per file, so the
+        kernel can overlap the reads instead of serving them one blocking
+        read at a time.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for f in files:
+            try:
+                fd = os.open(str(f), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(
+                    fd, 0, self.header_prefetch_bytes, os.POSIX_FADV_WILLNEED
+                )
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _file_for_name(name):
+        """File that IR `name` is read from.  Names are either paths or
+        tuples whose first element is the path."""
+        if isinstance(name, tuple):
+            name = name[0]
+        return name if isinstance(name, (str, os.PathLike)) else None
+
     def __getitem__(self, name):
-        self._populate_irs_list()
         ir = self._get_ir(name)
-        check_nonmono(ir)
+        if __debug__:
+            check_nonmono(ir)
         return ir
 
     def __len__(self):
+        if hasattr(self, "_irs_list"):
+            return len(self._irs_list)
+        return self._count_irs()
+
+    def _count_irs(self) -> int:
+        """Number of IRs.  Subclasses with a statically known layout override
+        this with a count that needs no metadata scan."""
         return len(self.list_irs())
 
     def list_irs(self):
@@ -151,18 +381,131 @@ class FileIRDataset(IRDataset[NAME_T]):
         return self._irs_list
 
     def _populate_irs_list(self):
-        if not hasattr(self, "_irs_list"):
-            self._irs_list = self._list_irs()
+        if hasattr(self, "_irs_list"):
+            return
+        key = self._metadata_cache_key()
+        cached = self._load_metadata_cache()
+        if cached is not None and cached[0] == key:
+            self._irs_list = cached[1]
+        else:
+            irs = self._list_irs()
+            # _list_irs may be a generator; materialize it exactly once here.
+            self._irs_list = irs if isinstance(irs, Sequence) else list(irs)
+            # Lazy lists hold no probed metadata yet, so there is nothing
+            # worth persisting for them.
+            if isinstance(self._irs_list, list):
+                self._save_metadata_cache(key, self._irs_list)
+
+    @property
+    def _metadata_cache_path(self) -> Optional[pathlib.Path]:
+        if self.metadata_cache_name is None:
+            return None
+        return self.root.joinpath(self.metadata_cache_name)
+
+    def _metadata_cache_key(self):
+        """Identity of the dataset's files: invalidates the cache when any
+        file is added, removed, or changes mtime/size.  The dataset class and
+        its patterns are part of the key so that different dataset classes
+        pointed at the same root never serve each other's metadata."""
+        key = [(type(self).__qualname__, tuple(self.file_patterns))]
+        for f in self.list_files():
+            try:
+                st = f.stat()
+            except OSError:
+                return None
+            key.append((str(f), st.st_mtime, st.st_size))
+        return key
+
+    def _load_metadata_cache(self):
+        if self._metadata_cache_path is None:
+            return None
+        try:
+            with open(self._metadata_cache_path, "rb") as fobj:
+                return pickle.load(fobj)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _save_metadata_cache(self, key, irs_list):
+        if self._metadata_cache_path is None or key is None:
+            return
+        try:
+            with open(self._metadata_cache_path, "wb") as fobj:
+                pickle.dump((key, irs_list), fobj)
+        except OSError:
+            # Read-only dataset root; simply skip the cache.
+            pass
 
     def _getall(self):
+        if self.num_workers is not None and self.num_workers > 1:
+            return self._getall_parallel()
         return ((name, sr, self[name]) for name, *_, sr in self.list_irs())
 
+    def _getall_parallel(self):
+        """Read IRs with `num_workers` threads, yielding in `list_irs` order.
+
+        The audio libraries release the GIL during I/O and decode, so reads
+        really do overlap.  At most ``2 * num_workers`` reads are in flight at
+        any time so that slow consumers do not cause unbounded memory use.
+        """
+        with concurrent.futures.ThreadPoolExecutor(self.num_workers) as executor:
+            pending = collections.deque()
+            for name, *_, sr in self.list_irs():
+                pending.append((name, sr, executor.submit(self._get_ir, name)))
+                if len(pending) >= 2 * self.num_workers:
+                    done_name, done_sr, future = pending.popleft()
+                    yield done_name, done_sr, future.result()
+            while pending:
+                done_name, done_sr, future = pending.popleft()
+                yield done_name, done_sr, future.result()
+
+
+class LazyIRList(Sequence):
+    """Sequence of ``(name, nchan, nsamples, sr)`` tuples that fetches metadata lazily.
+
+    Accessing an item probes (and memoizes) that item's metadata only, so datasets
+    whose IR names are known without opening any files can serve targeted access
+    without an upfront scan of every file.
+
+    Args:
+        names: IR names, one entry per IR.
+        get_metadata: Callable mapping a name to a ``(nchan, nsamples, sr)`` tuple.
+    """
+
+    def __init__(self, names, get_metadata):
+        self.names = names
+        self._get_metadata = get_metadata
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx not in self._cache:
+            name = self.names[idx]
+            self._cache[idx] = (name, *self._get_metadata(name))
+        return self._cache[idx]
+
 
 class CacheMixin:
+    """Small per-instance LRU cache for expensive loads (MAT/SOFA files).
+
+    Bounded so that iterating over a large dataset does not keep every
+    decoded file in memory; intra-file reuse only needs the last few entries.
+    """
+
+    #: Maximum number of cached entries.
+    cache_maxsize = 4
+
     def __init__(self):
-        self.__cache = {}
+        self.__cache = collections.OrderedDict()
 
     def cached(self, key, func, *args, **kwargs):
-        if key not in self.__cache:
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+        else:
             self.__cache[key] = func(*args, **kwargs)
+            while len(self.__cache) > self.cache_maxsize:
+                self.__cache.popitem(last=False)
         return self.__cache[key]
@@ -1,9 +1,15 @@
+import functools
+import importlib
+import mmap
+import os
 import pathlib
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 import numpy as np
 
-from .base import CacheMixin, FileIRDataset
+from .base import CacheMixin, FileIRDataset, LazyIRList
 
 
 class DelayedImportError:
@@ -14,32 +20,185 @@ class DelayedImportError:
         raise ImportError(f"Please install {self.name!r} to perform this operation.")
 
 
-try:
-    import scipy.io as scipy_io
-except ImportError:
-    scipy_io = DelayedImportError("scipy")
-try:
-    import soundfile
-except ImportError:
-    soundfile = DelayedImportError("soundfile")
-try:
-    import pysofaconventions as sofa_conv
-except ImportError:
-    sofa_conv = DelayedImportError("pysofaconventions")
-try:
-    import librosa
-except ImportError:
-    librosa = DelayedImportError("librosa")
+class LazyModule:
+    """Module placeholder that imports on first attribute access.
+
+    Keeps ``import realrirs.datasets`` fast even when heavy optional
+    dependencies (librosa in particular) are installed; a missing module
+    degrades into a `DelayedImportError`.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError:
+                self._module = DelayedImportError(self._name)
+        return getattr(self._module, attr)
+
+
+scipy_io = LazyModule("scipy.io")
+soundfile = LazyModule("soundfile")
+sofa_conv = LazyModule("pysofaconventions")
+netCDF4 = LazyModule("netCDF4")
+librosa = LazyModule("librosa")
+h5py = LazyModule("h5py")
 
 
 def _soundfile_info(f: pathlib.Path) -> Tuple[int, int, int]:
-    with soundfile.SoundFile(str(f)) as fobj:
-        return fobj.channels, len(fobj), fobj.samplerate
+    info = soundfile.info(str(f))
+    return info.channels, info.frames, info.samplerate
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_whosmat(path_str: str, mtime_ns: int, struct_as_record: bool = True):
+    """`scipy.io.whosmat`, memoized on (path, mtime) across dataset instances."""
+    return scipy_io.whosmat(path_str, struct_as_record=struct_as_record)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_loadmat(
+    path_str: str,
+    mtime_ns: int,
+    struct_as_record: bool = True,
+    variable_names: Tuple[str, ...] = None,
+):
+    """`scipy.io.loadmat`, memoized on (path, mtime).
+
+    Deliberately small maxsize: decoded MAT files can be large, and iteration
+    only ever revisits the last few files.
+    """
+    return scipy_io.loadmat(
+        path_str,
+        struct_as_record=struct_as_record,
+        variable_names=None if variable_names is None else list(variable_names),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_sofa_dims(path_str: str, mtime_ns: int):
+    """SOFA dimension dict, memoized on (path, mtime) across dataset instances."""
+    return sofa_conv.SOFAFile(path_str, "r").getDimensionsAsDict()
+
+
+def _soundfile_trim_indices(fobj):
+    """(first, last) nonzero sample indices of `fobj`'s first channel, or
+    None if the file is all zeros.
+
+    Reads growing blocks from both ends of the file instead of decoding all
+    samples, so long silent tails cost a few seeks.
+    """
+    n = len(fobj)
+    block = 16384
+    last = None
+    end = n
+    while end > 0 and last is None:
+        start = max(0, end - block)
+        fobj.seek(start)
+        data = fobj.read(end - start, dtype="float32", always_2d=True)[:, 0]
+        nonzero = np.flatnonzero(data)
+        if nonzero.size:
+            last = start + int(nonzero[-1])
+        end = start
+        block *= 2
+    if last is None:
+        return None
+    block = 16384
+    start = 0
+    while True:
+        fobj.seek(start)
+        data = fobj.read(min(block, n - start), dtype="float32", always_2d=True)[:, 0]
+        nonzero = np.flatnonzero(data)
+        if nonzero.size:
+            return start + int(nonzero[0]), last
+        start += len(data)
+        block *= 2
+
+
+def _thread_map(func, items):
+    """Map `func` over `items` with a thread pool, preserving order.
+
+    Used for per-file metadata probes, which mostly wait on I/O and release
+    the GIL inside libsndfile/netCDF/scipy.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return list(map(func, items))
+    with ThreadPoolExecutor(min(32, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def _read_mat_slice(f, var: str, idx: int):
+    """Read column `idx` of MAT variable `var` from `f`.
+
+    MAT v7.3 files are HDF5, so only the requested column is read (h5py
+    exposes MATLAB arrays transposed, hence the row index); older formats
+    fall back to a loadmat restricted to `var`.
+    """
+    try:
+        with h5py.File(str(f), "r") as fobj:
+            return np.asarray(fobj[var][idx])
+    except (OSError, ImportError):
+        return scipy_io.loadmat(str(f), variable_names=[var])[var][:, idx]
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_sofa_ir(path_str: str, mtime_ns: int):
+    """Decoded SOFA ``Data.IR`` tensor, memoized on (path, mtime).
+
+    Small maxsize since the tensors can be very large; iteration is per-file,
+    so a handful of entries is enough.  Call ``_cached_sofa_ir.cache_clear()``
+    to release the memory.
+    """
+    return sofa_conv.SOFAFile(path_str, "r").getDataIR()
+
+
+def _wav_memmap(f: pathlib.Path):
+    """Memory-map the sample data of `f` as a `(channels, samples)` array.
+
+    Returns None if `f` is not a simple uncompressed IEEE-float WAV file.
+    Integer WAVs are left to libsndfile since converting them to float
+    requires a copy anyway.
+    """
+    with open(f, "rb") as fobj:
+        header = fobj.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        fmt = None
+        while True:
+            chunk = fobj.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+            if chunk_id == b"fmt ":
+                fmt = fobj.read(chunk_size)
+                fobj.seek(chunk_size % 2, 1)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    return None
+                format_tag, channels, _, _, _, bits = struct.unpack("<HHIIHH", fmt[:16])
+                if format_tag != 3 or bits != 32:  # WAVE_FORMAT_IEEE_FLOAT only
+                    return None
+                frames = chunk_size // (channels * 4)
+                return np.memmap(
+                    str(f), "float32", "r", offset=fobj.tell(), shape=(frames, channels)
+                ).T
+            else:
+                fobj.seek(chunk_size + chunk_size % 2, 1)
 
 
 def _audioread_info(f: pathlib.Path) -> Tuple[int, int, int]:
-    with librosa.core.audio.audioread.audio_open(str(f)) as fobj:
-        return fobj.channels, fobj.duration * fobj.samplerate, fobj.samplerate
+    try:
+        # libsndfile handles FLAC and friends with a header-only read, much
+        # cheaper than spinning up an audioread decoder.
+        return _soundfile_info(f)
+    except (ImportError, RuntimeError):
+        with librosa.core.audio.audioread.audio_open(str(f)) as fobj:
+            return fobj.channels, fobj.duration * fobj.samplerate, fobj.samplerate
 
 
 class FOAIRDataset(FileIRDataset[Tuple[str, int]], CacheMixin):
@@ -51,15 +210,19 @@ class FOAIRDataset(FileIRDataset[Tuple[str, int]], CacheMixin):
 
     def _list_irs(self):
         files = self.list_files()
-        mat_irs = [
-            ((f, i), 2, n_samples, 48000)
-            for f, _, (n_samples, n_irs), _ in [
-                (f, *scipy_io.whosmat(f)[0]) for f in files if f.match("*.mat")
-            ]
-            for i in range(n_irs)
-        ]
-        wav_irs = [((f, -1), *_soundfile_info(f)) for f in files if f.match("*.wav")]
-        return mat_irs + wav_irs
+        self._prefetch_headers(files)
+        mat_files = [f for f in files if f.match("*.mat")]
+        wav_files = [f for f in files if f.match("*.wav")]
+        for f, (_, (n_samples, n_irs), _) in zip(
+            mat_files,
+            _thread_map(
+                lambda f: _cached_whosmat(str(f), f.stat().st_mtime_ns)[0], mat_files
+            ),
+        ):
+            for i in range(n_irs):
+                yield (f, i), 2, n_samples, 48000
+        for f, info in zip(wav_files, _thread_map(_soundfile_info, wav_files)):
+            yield ((f, -1), *info)
 
     def _get_ir(self, name):
         fpath, idx = name
@@ -68,7 +231,21 @@ class FOAIRDataset(FileIRDataset[Tuple[str, int]], CacheMixin):
                 return fobj.read().T
         else:
             mat = self.cached(("loadmat", fpath), scipy_io.loadmat, fpath)
-            return np.array([mat["IR_L"][:, idx], mat["IR_R"][:, idx]])
+            return np.stack((mat["IR_L"][:, idx], mat["IR_R"][:, idx]))
+
+    def _getall(self):
+        files = self.list_files()
+        for f in files:
+            if f.match("*.mat"):
+                mat = scipy_io.loadmat(f)
+                for idx in range(mat["IR_L"].shape[1]):
+                    yield (f, idx), 48000, np.stack(
+                        (mat["IR_L"][:, idx], mat["IR_R"][:, idx])
+                    )
+        for f in files:
+            if f.match("*.wav"):
+                with soundfile.SoundFile(str(f)) as fobj:
+                    yield (f, -1), fobj.samplerate, fobj.read().T
 
 
 class AIRDataset(FileIRDataset[str]):
@@ -79,46 +256,53 @@ class AIRDataset(FileIRDataset[str]):
     file_patterns = ["**/*.mat"]
 
     def _list_irs(self):
-        files = self.list_files()
-        return [
-            (
-                f,
-                *[
-                    info
-                    for name, info, _ in scipy_io.whosmat(f, struct_as_record=False)
-                    if name == "h_air"
-                ][0],
-                48000,
+        return LazyIRList(self.list_files(), self._get_metadata)
+
+    def _get_metadata(self, f):
+        (info,) = [
+            info
+            for name, info, _ in _cached_whosmat(
+                str(f), f.stat().st_mtime_ns, struct_as_record=False
             )
-            for f in files
+            if name == "h_air"
         ]
+        return (*info, 48000)
 
     def _get_ir(self, name):
-        return scipy_io.loadmat(name, struct_as_record=False)["h_air"]
+        return scipy_io.loadmat(
+            name, struct_as_record=False, variable_names=["h_air"]
+        )["h_air"]
 
 
 class SoundfileDataset(FileIRDataset[pathlib.Path]):
     """Base class for datasets that can be read by `soundfile`."""
 
     def _list_irs(self):
-        files = self.list_files()
-        return [(f, *_soundfile_info(f)) for f in files]
+        return LazyIRList(self.list_files(), _soundfile_info)
 
     def _get_ir(self, name):
-        with soundfile.SoundFile(name) as fobj:
-            data = fobj.read()
-            if data.ndim == 1:
-                return data.reshape((1, -1))
-            else:
-                return data.T
+        # float32 halves memory vs. libsndfile's float64 default and loses
+        # nothing relative to the source material's precision.
+        data, _ = soundfile.read(str(name), dtype="float32", always_2d=True)
+        # Fortran order makes the transposed (channels, samples) result
+        # C-contiguous, so FFT/convolution consumers don't re-copy a strided
+        # view.
+        return np.asfortranarray(data).T
+
+    def trimmed_len(self, name):
+        with soundfile.SoundFile(str(name)) as fobj:
+            indices = _soundfile_trim_indices(fobj)
+        if indices is None:
+            return 0
+        first, last = indices
+        return last - first + 1
 
 
 class LibrosaDataset(FileIRDataset[pathlib.Path]):
     """Base class for datasets that can be read by `librosa` (most audio files)."""
 
     def _list_irs(self):
-        files = self.list_files()
-        return [(f, *_audioread_info(f)) for f in files]
+        return LazyIRList(self.list_files(), _audioread_info)
 
     def _get_ir(self, name):
         data = librosa.core.load(name, sr=None, mono=False)[0]
@@ -131,6 +315,12 @@ class LibrosaDataset(FileIRDataset[pathlib.Path]):
 class WavDataset(SoundfileDataset):
     file_patterns = ["**/*.wav"]
 
+    def _get_ir(self, name):
+        ir = _wav_memmap(name)
+        if ir is not None:
+            return ir
+        return super()._get_ir(name)
+
 
 class FlacDataset(LibrosaDataset):
     file_patterns = ["**/*.flac"]
@@ -152,7 +342,7 @@ class HopkinsDataset(WavDataset):
     file_patterns = ["Real Spaces/**/*.wav"]
 
 
-class IOSRRealRoomsDataset(FileIRDataset[Tuple[pathlib.Path, int, int]], CacheMixin):
+class IOSRRealRoomsDataset(FileIRDataset[Tuple[pathlib.Path, int, int]]):
     name = "Surrey Binaural Room Impulse Response Measurements"
     url = "https://github.com/IoSR-Surrey/RealRoomBRIRs"
     license = "MIT"
@@ -161,21 +351,34 @@ class IOSRRealRoomsDataset(FileIRDataset[Tuple[pathlib.Path, int, int]], CacheMi
 
     def _list_irs(self):
         files = self.list_files()
-        return [
-            ((f, measurement, receiver), 1, dims["N"].size, 48000)
-            for f, dims in [
-                (f, sofa_conv.SOFAFile(str(f), "r").getDimensionsAsDict())
-                for f in files
-            ]
-            for measurement in range(dims["M"].size)
-            for receiver in range(dims["R"].size)
-        ]
+        self._prefetch_headers(files)
+        for f, dims in zip(
+            files,
+            _thread_map(
+                lambda f: _cached_sofa_dims(str(f), f.stat().st_mtime_ns), files
+            ),
+        ):
+            for measurement in range(dims["M"].size):
+                for receiver in range(dims["R"].size):
+                    yield (f, measurement, receiver), 1, dims["N"].size, 48000
 
     def _get_ir(self, name):
         fpath, measurement, receiver = name
-        return self.cached(fpath, sofa_conv.SOFAFile(str(fpath), "r").getDataIR)[
-            measurement, receiver
-        ].reshape((1, -1))
+        # SOFA files are netCDF; slice just the requested IR instead of
+        # decoding the full (M, R, N) tensor.
+        with netCDF4.Dataset(str(fpath), "r") as fobj:
+            return np.asarray(
+                fobj.variables["Data.IR"][measurement, receiver]
+            ).reshape((1, -1))
+
+    def _getall(self):
+        for f in self.list_files():
+            data = _cached_sofa_ir(str(f), f.stat().st_mtime_ns)
+            for measurement in range(data.shape[0]):
+                for receiver in range(data.shape[1]):
+                    yield (f, measurement, receiver), 48000, data[
+                        measurement, receiver
+                    ].reshape((1, -1))
 
 
 class KEMARDataset(FileIRDataset[Tuple[pathlib.Path, str]]):
@@ -185,18 +388,28 @@ class KEMARDataset(FileIRDataset[Tuple[pathlib.Path, str]]):
 
     file_patterns = ["**/*.mat"]
     surround_types = ["L", "LS", "R", "RS", "C", "S"]
+    # The IR list is derived from the file list alone; recomputing it is
+    # cheaper than validating a sidecar cache.
+    metadata_cache_name = None
 
     def _list_irs(self):
         files = self.list_files()
         return [((f, t), 2, 96000, 48000) for f in files for t in self.surround_types]
 
+    def _count_irs(self):
+        return len(self.list_files()) * len(self.surround_types)
+
     def _get_ir(self, name):
         fpath, surround_type = name
-        irs = scipy_io.loadmat(fpath, struct_as_record=False)["brirData"][0][
-            0
-        ].impulseResponse
+        irs = _cached_loadmat(
+            str(fpath),
+            fpath.stat().st_mtime_ns,
+            struct_as_record=False,
+            variable_names=("brirData",),
+        )["brirData"][0][0].impulseResponse
         (ir,) = [ir for t, ir in irs if t[0] == surround_type]
-        return ir.T
+        # Copy so callers cannot mutate the shared _cached_loadmat entry.
+        return ir.T.copy()
 
     def _getall(self):
         for f in self.list_files():
@@ -214,16 +427,18 @@ class MIRDDataset(FileIRDataset[Tuple[pathlib.Path, int]]):
     license = "?"
 
     file_patterns = ["**/*.mat"]
+    metadata_cache_name = None
 
     def _list_irs(self):
         files = self.list_files()
         return [((f, i), 1, 480000, 48000) for f in files for i in range(8)]
 
+    def _count_irs(self):
+        return len(self.list_files()) * 8
+
     def _get_ir(self, name):
         fpath, i = name
-        return scipy_io.loadmat(fpath, struct_as_record=False)["impulse_response"][
-            :, i
-        ].reshape((1, -1))
+        return _read_mat_slice(fpath, "impulse_response", i).reshape((1, -1))
 
     def _getall(self):
         for f in self.list_files():
@@ -248,6 +463,8 @@ class TUIInEarBehindEarDataset(FileIRDataset[Tuple[pathlib.Path, str, int]]):
     url = "https://github.com/pyBinSim/HeadRelatedDatabase"
     license = "CC BY-NC 4.0"
 
+    metadata_cache_name = None
+
     def _list_files(self):
         return [
             self.root.joinpath("lab_brirs.mat"),
@@ -264,11 +481,16 @@ class TUIInEarBehindEarDataset(FileIRDataset[Tuple[pathlib.Path, str, int]]):
             + [((tvstudio, t, i), 2, 22050, 44100) for t, i in cfgs]
         )
 
+    def _count_irs(self):
+        return len(self.list_files()) * 2 * 32
+
     def _get_ir(self, name):
         fpath, t, i = name
-        mat = scipy_io.loadmat(fpath, struct_as_record=False)
-        mat = getattr(mat[list(mat.keys())[-1]][0][0], t)[0][0]
-        return np.array([mat.left[i], mat.right[i]])
+        mat = _cached_loadmat(
+            str(fpath), fpath.stat().st_mtime_ns, struct_as_record=False
+        )
+        mat = getattr(mat[next(reversed(mat))][0][0], t)[0][0]
+        return np.stack((mat.left[i], mat.right[i]))
 
     def _getall(self):
         for f in self.list_files():
@@ -277,14 +499,16 @@ class TUIInEarBehindEarDataset(FileIRDataset[Tuple[pathlib.Path, str, int]]):
             for t in ["inear", "btear"]:
                 data = getattr(mat, t)[0][0]
                 for idx, (l, r) in enumerate(zip(data.left, data.right)):
-                    yield (f, t, idx), 44100, np.array([l, r])
+                    yield (f, t, idx), 44100, np.stack((l, r))
 
 
-class BellVarechoicDataset(FileIRDataset[Tuple[pathlib.Path, int]]):
+class BellVarechoicDataset(FileIRDataset[Tuple[pathlib.Path, int]], CacheMixin):
     name = "Impulse Responses from the Bell Labs Varechoic Chamber"
     url = "?"
     license = "?"
 
+    metadata_cache_name = None
+
     def _list_files(self):
         return [
             self.root.joinpath("IR_00.mat"),
@@ -294,18 +518,29 @@ class BellVarechoicDataset(FileIRDataset[Tuple[pathlib.Path, int]]):
 
     def _list_irs(self):
         files = self.list_files()
-        return [((f, i), 1, 8192, 10000) for i in range(4) for f in files]
+        # File-outer order (like MIRD/KEMAR) so sequential iteration visits a
+        # file's four indices back to back and they share one cached parse.
+        return [((f, i), 1, 8192, 10000) for f in files for i in range(4)]
+
+    def _count_irs(self):
+        return len(self.list_files()) * 4
 
     def _get_ir(self, name):
         fpath, i = name
-        return (
-            list(scipy_io.loadmat(fpath).values())[0][:, i]
-            .astype("float64")
-            .reshape((1, -1))
+        # Each file holds a single real variable; look up its name once and
+        # restrict loadmat to it, sharing the parse across all four indices.
+        varname = self.cached(
+            ("whosmat", fpath), lambda: scipy_io.whosmat(str(fpath))[0][0]
         )
+        mat = self.cached(
+            ("loadmat", fpath), scipy_io.loadmat, fpath, variable_names=[varname]
+        )
+        # Always copy: with copy=False a float32 variable would hand the
+        # caller a writable view into the cached matrix.
+        return mat[varname][:, i].astype("float32").reshape((1, -1))
 
 
-class IOSRListeningRoomsDataset(FileIRDataset[Tuple[pathlib.Path, int]], CacheMixin):
+class IOSRListeningRoomsDataset(FileIRDataset[Tuple[pathlib.Path, int]]):
     name = "The IoSR listening room multichannel BRIR dataset"
     url = "https://github.com/IoSR-Surrey/IoSR_ListeningRoom_BRIRs"
     license = "CC BY 4.0"
@@ -314,20 +549,26 @@ class IOSRListeningRoomsDataset(FileIRDataset[Tuple[pathlib.Path, int]], CacheMi
 
     def _list_irs(self):
         files = self.list_files()
-        return [
-            ((f, measurement), dims["R"].size, dims["N"].size, 48000)
-            for f, dims in [
-                (f, sofa_conv.SOFAFile(str(f), "r").getDimensionsAsDict())
-                for f in files
-            ]
-            for measurement in range(dims["M"].size)
-        ]
+        self._prefetch_headers(files)
+        for f, dims in zip(
+            files,
+            _thread_map(
+                lambda f: _cached_sofa_dims(str(f), f.stat().st_mtime_ns), files
+            ),
+        ):
+            for measurement in range(dims["M"].size):
+                yield (f, measurement), dims["R"].size, dims["N"].size, 48000
 
     def _get_ir(self, name):
         fpath, measurement = name
-        return self.cached(fpath, sofa_conv.SOFAFile(str(fpath), "r").getDataIR)[
-            measurement
-        ]
+        with netCDF4.Dataset(str(fpath), "r") as fobj:
+            return np.asarray(fobj.variables["Data.IR"][measurement])
+
+    def _getall(self):
+        for f in self.list_files():
+            data = _cached_sofa_ir(str(f), f.stat().st_mtime_ns)
+            for measurement in range(data.shape[0]):
+                yield (f, measurement), 48000, data[measurement]
 
 
 class BinaryArrayDataset(FileIRDataset[pathlib.Path]):
@@ -343,20 +584,31 @@ class BinaryArrayDataset(FileIRDataset[pathlib.Path]):
     #: Data type of the array (str or dtype object)
     dtype = "float32"
 
+    metadata_cache_name = None
+
     def __init__(self, *args, **kwargs):
         self.use_memmap = kwargs.pop("use_memmap", True)
         super().__init__(*args, **kwargs)
 
     def _list_irs(self):
         files = self.list_files()
+        itemsize = np.dtype(self.dtype).itemsize
         return [
-            (f, 1, f.stat().st_size / np.dtype(self.dtype).itemsize, self.sample_rate)
-            for f in files
+            (f, 1, f.stat().st_size // itemsize, self.sample_rate) for f in files
         ]
 
     def _get_ir(self, name):
         if self.use_memmap:
-            return np.memmap(name, self.dtype, "r").reshape((1, -1))
+            fd = os.open(str(name), os.O_RDONLY)
+            try:
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # The arrays are consumed in one sequential pass; let the
+                # kernel read ahead aggressively.
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return np.frombuffer(mapped, dtype=self.dtype).reshape((1, -1))
         else:
             return np.fromfile(name, self.dtype).reshape((1, -1))
 
@@ -370,9 +622,13 @@ class RWCPDataset(BinaryArrayDataset):
     file_patterns = ["near/data/rsp*/*", "micarray/**/imp*.*"]
 
     def _get_ir(self, name):
-        data = super()._get_ir(name)
-        # Normalize very large values
-        return data / np.abs(data).max()
+        # Normalize very large values.  Copy the read-only mapping into a
+        # writable buffer once, find the peak via max/-min (no np.abs
+        # temporary), and divide in place — no further allocations.
+        data = np.array(super()._get_ir(name))
+        peak = max(data.max(), -data.min())
+        np.divide(data, peak, out=data)
+        return data
 
 
 class BUTDataset(WavDataset):
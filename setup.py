@@ -13,9 +13,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     license="ISC",
-    python_requires=">=3.4",
+    python_requires=">=3.8",
     extras_require={
-        "full": ["librosa", "pysofaconventions", "scipy", "soundfile"],
+        "full": ["h5py", "librosa", "pysofaconventions", "scipy", "soundfile"],
     },
     packages=find_packages(),
     include_package_data=True,